@@ -1,17 +1,52 @@
-from flask import Flask, render_template, request, send_file, after_this_request, flash
-from scheduler import InternScheduler
+from flask import Flask, render_template, request, send_file, flash, redirect, url_for
 from datetime import datetime
-import os
+from concurrent.futures import ThreadPoolExecutor
+import io
+import threading
+import time
+import uuid
 
 app = Flask(__name__)
 
 # Set a secret key for session management and flash messages
 app.secret_key = 'duty_scheduler_chich'.encode('utf8')
 
+# Run solve + Excel generation off the request thread so long CBC runs don't
+# block other requests; jobs are looked up by id on the download route.
+# Each entry is (future, submit time) so abandoned jobs whose download URL is
+# never visited can be evicted instead of accumulating for the process lifetime
+executor = ThreadPoolExecutor(max_workers=2)
+jobs = {}
+JOB_TTL_SECONDS = 600
+
+
+def evict_stale_jobs():
+    cutoff = time.time() - JOB_TTL_SECONDS
+    for job_id in [j for j, (_, submitted) in jobs.items() if submitted < cutoff]:
+        # Default the pop: a concurrent request may have evicted this id first
+        future, _ = jobs.pop(job_id, (None, None))
+        if future is not None:
+            future.cancel()
+
+# scheduler pulls in numpy/pandas/pulp, so it is imported lazily in the view;
+# pre-warm it off the main thread so the first POST doesn't pay the import cost
+threading.Thread(target=lambda: __import__('scheduler'), daemon=True).start()
+
+
+def generate_schedule(scheduler):
+    scheduler.solve(randomize=True)
+    # Build the workbook in memory; no temp file to clean up or collide on
+    buf = io.BytesIO()
+    scheduler.create_calendar(buf)
+    buf.seek(0)
+    return buf
+
+
 @app.route('/', methods=['GET', 'POST'])
 def index():
     if request.method == 'POST':
-        try: 
+        from scheduler import InternScheduler
+        try:
           # Get form data
           start_date = request.form['start_date']
           end_date = request.form['end_date']
@@ -19,7 +54,7 @@ def index():
           min_interns_per_duty = int(request.form['min_interns_per_duty'])
           units_per_intern = int(request.form['units_per_intern'])
           minimum_spacing = int(request.form['minimum_spacing'])
-          
+
           # Parse dates
           start_date = datetime.strptime(start_date, '%Y-%m-%d')
           end_date = datetime.strptime(end_date, '%Y-%m-%d')
@@ -29,26 +64,15 @@ def index():
           units_dict = {intern: units_per_intern for intern in interns}
           scheduler = InternScheduler(start_date, end_date, interns, units_dict, min_interns_per_duty, minimum_spacing)
 
-          # Solve the scheduling problem
-          scheduler.solve(randomize=True)
-
-          # Define the output path in the flask_app directory
-          output_file = os.path.join(os.getcwd(), "temp", 'schedule.xlsx')
+          # Validate the inputs before queueing so errors flash immediately
+          scheduler.verify_units(scheduler.calculate_total_required_units())
 
-          # Create the calendar and save it as an Excel file
-          scheduler.create_calendar(output_file)
+          # Queue the solve and hand the user a job-specific download URL
+          evict_stale_jobs()
+          job_id = uuid.uuid4().hex
+          jobs[job_id] = (executor.submit(generate_schedule, scheduler), time.time())
 
-          # Hook into the response to delete the file after it has been sent
-          @after_this_request
-          def remove_file(response):
-              try:
-                  os.remove(output_file)  # Delete the file after the response is sent
-              except Exception as e:
-                  print(f"Error removing or closing downloaded file handle: {e}")
-              return response
-
-          # Send the Excel file to the user for download
-          return send_file(output_file, as_attachment=True)
+          return redirect(url_for('download', job_id=job_id))
 
         except ValueError as e:
               # Catch the ValueError and pass the message to the template
@@ -63,6 +87,35 @@ def index():
     return render_template('index.html')
 
 
+@app.route('/download/<job_id>')
+def download(job_id):
+    evict_stale_jobs()
+    future, _ = jobs.pop(job_id, (None, None))
+    if future is None:
+        flash("Unknown, expired, or already downloaded schedule.")
+        return render_template('index.html')
+
+    try:
+        # Wait for the background solve to finish
+        buf = future.result()
+    except ValueError as e:
+        flash(str(e))
+        return render_template('index.html')
+    except Exception as e:
+        flash(f"An unexpected error occurred: {str(e)}")
+        return render_template('index.html')
+
+    # Send the in-memory workbook to the user for download
+    return send_file(
+        buf,
+        as_attachment=True,
+        download_name='schedule.xlsx',
+        mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    )
+
+
 
 if __name__ == '__main__':
-    app.run(debug=True)
+    # Development entry point only; in production run behind a real WSGI
+    # server, e.g. gunicorn --threads 8 app:app
+    app.run(debug=False, threaded=True)
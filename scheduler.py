@@ -1,37 +1,112 @@
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
+import os
 import pulp
+from pulp import PULP_CBC_CMD
 from openpyxl import Workbook
-from openpyxl.utils.dataframe import dataframe_to_rows
-from openpyxl.styles import PatternFill, Font, Border, Side, Alignment
+from openpyxl.styles import PatternFill, Font, Border, Side, Alignment, NamedStyle
 import random
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _compute_metrics(A, units, weekday):
+    """Per-intern duty counts, unit totals, and spacing sums from the
+    (interns x dates) assignment matrix. Written as plain scalar loops so
+    numba can compile it; a spacing sum of -1 means no shifts assigned."""
+    num_interns, num_dates = A.shape
+    weekdays = np.zeros(num_interns, dtype=np.int64)
+    saturdays = np.zeros(num_interns, dtype=np.int64)
+    sundays = np.zeros(num_interns, dtype=np.int64)
+    units_used = np.zeros(num_interns, dtype=np.int64)
+    num_shifts = np.zeros(num_interns, dtype=np.int64)
+    spacing_sums = np.full(num_interns, -1, dtype=np.int64)
+    for k in range(num_interns):
+        first = -1
+        prev = -1
+        gaps = 0
+        for j in range(num_dates):
+            if A[k, j]:
+                if weekday[j] < 5:
+                    weekdays[k] += 1
+                elif weekday[j] == 5:
+                    saturdays[k] += 1
+                else:
+                    sundays[k] += 1
+                units_used[k] += units[j]
+                num_shifts[k] += 1
+                if prev >= 0:
+                    gaps += j - prev
+                else:
+                    first = j
+                prev = j
+        if first >= 0:
+            spacing_sums[k] = first + (num_dates - 1 - prev) + gaps
+    return weekdays, saturdays, sundays, units_used, num_shifts, spacing_sums
+
+
+# No parallel=True: the kernel runs from worker threads (see app.py), where
+# numba's workqueue threading layer can wedge, and the matrix is tiny anyway
+if njit is not None:
+    _compute_metrics = njit(cache=True)(_compute_metrics)
+else:
+    def _compute_metrics(A, units, weekday):
+        """Vectorized fallback for when numba is not installed."""
+        num_dates = A.shape[1]
+        weekdays = A[:, weekday < 5].sum(axis=1)
+        saturdays = A[:, weekday == 5].sum(axis=1)
+        sundays = A[:, weekday == 6].sum(axis=1)
+        units_used = A @ units
+        num_shifts = A.sum(axis=1, dtype=np.int64)
+        spacing_sums = np.full(A.shape[0], -1, dtype=np.int64)
+        for k in range(A.shape[0]):
+            idxs = np.flatnonzero(A[k])
+            if idxs.size:
+                spacing_sums[k] = idxs[0] + (num_dates - 1 - idxs[-1]) + np.diff(idxs).sum()
+        return weekdays, saturdays, sundays, units_used, num_shifts, spacing_sums
+
 
 class InternScheduler:
-    def __init__(self, start_date, end_date, interns, units_per_intern, min_interns_per_duty, minimum_spacing=1):
+    def __init__(self, start_date, end_date, interns, units_per_intern, min_interns_per_duty, minimum_spacing=1, solver=None):
         self.start_date = start_date
         self.end_date = end_date
         self.interns = interns
         self.units_per_intern = units_per_intern
         self.min_interns_per_duty = min_interns_per_duty
         self.minimum_spacing = minimum_spacing
+        # Allow callers to pass any pulp solver (e.g. HiGHS_CMD or GUROBI);
+        # by default use CBC tuned with all but one core and a time limit
+        self.solver = solver if solver is not None else PULP_CBC_CMD(
+            threads=max(1, (os.cpu_count() or 1) - 1),
+            msg=False,
+            timeLimit=60,
+            options=['preprocess on', 'cuts on', 'heuristics on'],
+        )
         self.dates = self.generate_dates(start_date, end_date)
+        # Precompute per-day weekday/unit lookups once; constraint building and
+        # solution extraction index these instead of calling .weekday() per cell
+        self.weekday = [d.weekday() for d in self.dates]
+        self.units = [2 if w == 5 else 3 if w == 6 else 1 for w in self.weekday]
+        self.sat_idx = [j for j, w in enumerate(self.weekday) if w == 5]
+        self.sun_idx = [j for j, w in enumerate(self.weekday) if w == 6]
+        self._date_to_idx = {d: j for j, d in enumerate(self.dates)}
+        # NumPy inputs for the _compute_metrics kernel
+        self.units_arr = np.asarray(self.units, dtype=np.int64)
+        self.weekday_arr = np.asarray(self.weekday, dtype=np.int64)
         self.schedule = None
         self.intern_metrics = None
+        # Cached (prob, V) so repeat solves reuse the built model
+        self._model = None
 
     def generate_dates(self, start_date, end_date):
         return pd.date_range(start=start_date, end=end_date).to_pydatetime().tolist()
 
     def calculate_total_required_units(self):
-        total_units = 0
-        for d in self.dates:
-            if d.weekday() == 5:  # Saturday
-                total_units += 2
-            elif d.weekday() == 6:  # Sunday
-                total_units += 3
-            else:  # Weekdays
-                total_units += 1
-        return total_units
+        return sum(self.units)
 
     def verify_units(self, total_required_units):
         total_required_units_interns = total_required_units * self.min_interns_per_duty
@@ -44,132 +119,158 @@ class InternScheduler:
         else:
             print(f"Total number of intern units ({total_intern_units}) is sufficient to cover the required {total_required_units} units and the minimum {self.min_interns_per_duty} interns per duty.")
 
-    def solve(self, randomize = True):
-        total_required_units = self.calculate_total_required_units()
-        self.verify_units(total_required_units)
+    def _build_model(self):
+        """Build (or return the cached) PuLP model and its variable grid.
 
-        # Create shuffled list for randomness
-        shuffled_interns = self.interns[:]  # Create a copy of the original list
-        random.shuffle(shuffled_interns)
-
-        if randomize:
-            random.shuffle(self.interns)
+        The constraints only depend on the constructor parameters, so repeat
+        solves on the same scheduler reuse the model and vary the objective
+        instead of rebuilding every LpConstraint from scratch.
+        """
+        if self._model is not None:
+            return self._model
 
         # Initialize the problem
         prob = pulp.LpProblem("Intern_Schedule_Optimization", pulp.LpMaximize)
 
-        # Define decision variables (1 if an intern is assigned to a day, 0 otherwise)
-        intern_vars = pulp.LpVariable.dicts("Duty", ((i, d) for i in self.interns for d in self.dates), cat='Binary')
+        num_interns = len(self.interns)
+        num_dates = len(self.dates)
+
+        # Define decision variables (1 if an intern is assigned to a day, 0
+        # otherwise) as a 2D list indexed by (intern position, date position);
+        # LpVariable.matrix allocates the whole grid in bulk instead of a
+        # Python-level name-format-and-construct call per variable
+        V = pulp.LpVariable.matrix("Duty", (list(range(num_interns)), list(range(num_dates))), 0, 1, cat='Binary')
 
         # Add constraints to ensure the minimum number of interns per duty
-        for d in self.dates:
-            prob += pulp.lpSum([intern_vars[(i, d)] for i in self.interns]) >= self.min_interns_per_duty, f"Min_Interns_on_{d}"
+        # LpAffineExpression over a generator avoids the temporary list and the
+        # repeated expression copies lpSum would make on a model this size
+        for jj in range(num_dates):
+            prob += pulp.LpAffineExpression(((V[ii][jj], 1) for ii in range(num_interns))) >= self.min_interns_per_duty, f"Min_Interns_on_{jj}"
 
         # Add constraints to ensure that each intern fills the required number of units
-        for i in self.interns:
-            total_units = pulp.lpSum([intern_vars[(i, d)] * self.get_units_for_day(d) for d in self.dates])
+        for ii, i in enumerate(self.interns):
+            total_units = pulp.LpAffineExpression(((V[ii][jj], self.units[jj]) for jj in range(num_dates)))
             prob += total_units == self.units_per_intern[i], f"Units_for_{i}"
-        
+
         # Add constraints to ensure that each intern is given the same amount of weekends
         # Calculate the total number of weekdays, Saturdays, and Sundays
-        num_weekdays = sum(1 for d in self.dates if d.weekday() < 5)
-        num_saturdays = sum(1 for d in self.dates if d.weekday() == 5)
-        num_sundays = sum(1 for d in self.dates if d.weekday() == 6)
+        num_saturdays = len(self.sat_idx)
+        num_sundays = len(self.sun_idx)
 
         # Calculate the expected number of duties per intern
-        expected_weekdays = (num_weekdays * self.min_interns_per_duty) // len(self.interns)
         expected_saturdays = (num_saturdays * self.min_interns_per_duty) // len(self.interns)
         expected_sundays = (num_sundays * self.min_interns_per_duty) // len(self.interns)
 
-        # Calculate the remainder of duties that need to be distributed
-        remainder_weekdays = (num_weekdays * self.min_interns_per_duty) % len(self.interns)
-        remainder_saturdays = (num_saturdays * self.min_interns_per_duty) % len(self.interns)
-        remainder_sundays = (num_sundays * self.min_interns_per_duty) % len(self.interns)
-
-        weekend_distribution = {intern : [expected_saturdays, expected_sundays] for intern in self.interns}
-
-        while remainder_saturdays > 0 and remainder_sundays > 0:
-          for intern in shuffled_interns:
-            if remainder_saturdays == 0 and remainder_sundays == 0:
-              break
-            if remainder_saturdays > 0:
-              weekend_distribution[intern][0] += 1
-              remainder_saturdays -= 1
-              continue
-            if remainder_sundays > 0:
-              weekend_distribution[intern][1] += 1
-              remainder_sundays -= 1
-              continue
-
-        for i in self.interns:
+        # Fairness floors instead of equalities: every intern must do at least
+        # the expected number of Saturdays/Sundays, and the solver is free to
+        # place the remainder duties wherever it likes. Equalities pinned the
+        # exact counts and gave CBC 2*|interns| extra equalities to presolve
+        for ii, i in enumerate(self.interns):
           # Constraint for Saturdays
-          prob += pulp.lpSum([intern_vars[(i, d)] for d in self.dates if d.weekday() == 5]) == weekend_distribution[i][0], f"Saturday_Duties_for_{i}"
+          prob += pulp.LpAffineExpression(((V[ii][jj], 1) for jj in self.sat_idx)) >= expected_saturdays, f"Saturday_Duties_for_{i}"
 
           # Constraint for Sundays
-          prob += pulp.lpSum([intern_vars[(i, d)] for d in self.dates if d.weekday() == 6]) == weekend_distribution[i][1], f"Sunday_Duties_for_{i}"
+          prob += pulp.LpAffineExpression(((V[ii][jj], 1) for jj in self.sun_idx)) >= expected_sundays, f"Sunday_Duties_for_{i}"
+
+        # Enforce minimum spacing between shifts of the same intern: at most one
+        # shift in any window of minimum_spacing + 1 consecutive days. A single
+        # windowed constraint subsumes all the pairwise <= 1 constraints inside
+        # the window, cutting the constraint count by ~minimum_spacing while
+        # giving the solver a tighter LP relaxation
+        if self.minimum_spacing > 0:
+            for ii, i in enumerate(self.interns):
+                for j in range(max(1, num_dates - self.minimum_spacing)):
+                    window = V[ii][j:j + self.minimum_spacing + 1]
+                    prob += pulp.LpAffineExpression(((v, 1) for v in window)) <= 1, f"Min_Spacing_Shifts_{i}_{j}"
+
+        # Break symmetry between interchangeable interns: interns with the same
+        # quota can be permuted in any feasible schedule, which multiplies the
+        # branch-and-bound tree. Ordering each group by its first-half duty
+        # count keeps one representative per permutation class
+        half = num_dates // 2
+        quota_groups = {}
+        for ii, i in enumerate(self.interns):
+            quota_groups.setdefault(self.units_per_intern[i], []).append(ii)
+        for grp in quota_groups.values():
+            for a, b in zip(grp, grp[1:]):
+                first_half = [(v, 1) for v in V[a][:half]] + [(v, -1) for v in V[b][:half]]
+                prob += pulp.LpAffineExpression(first_half) >= 0, f"Symmetry_{a}_{b}"
+
+        self._model = (prob, V)
+        return self._model
 
-        # Enforce minimum spacing between shifts of the same intern
-        for i in self.interns:
-            for j in range(len(self.dates)):  # Loop through all dates
-                d1 = self.dates[j]
-                for k in range(1, self.minimum_spacing + 1):  # Ensure spacing up to the minimum_spacing days
-                    if j + k < len(self.dates):  # Ensure we are within the valid date range
-                        d2 = self.dates[j + k]
-                        prob += intern_vars[(i, d1)] + intern_vars[(i, d2)] <= 1, f"Min_Spacing_Shifts_{i}_{d1}_{d2}"
+    def solve(self, randomize = True):
+        total_required_units = self.calculate_total_required_units()
+        self.verify_units(total_required_units)
+
+        # Shuffling only matters before the model is built; afterwards the
+        # randomness comes from the random objective below
+        if randomize and self._model is None:
+            random.shuffle(self.interns)
+
+        prob, V = self._build_model()
+        num_interns = len(self.interns)
+        num_dates = len(self.dates)
+
+        if randomize:
+            # A random objective makes each solve prefer a different schedule
+            # among the feasible ones, replacing a full model rebuild per run
+            prob.setObjective(pulp.LpAffineExpression(
+                ((V[ii][jj], random.random()) for ii in range(num_interns) for jj in range(num_dates))))
+
+        if self.schedule is not None:
+            # Warm-start repeat solves from the previous assignment
+            for row in V:
+                for v in row:
+                    if v.varValue is not None:
+                        v.setInitialValue(round(v.varValue))
+            self.solver.optionsDict["warmStart"] = True
 
         # Solve the problem
-        prob.solve()
+        prob.solve(self.solver)
+
+        # Don't extract from an infeasible model or a run the time limit cut
+        # off before any feasible incumbent was found; app.py catches the
+        # ValueError and flashes it to the user
+        if prob.sol_status not in (pulp.LpSolutionOptimal, pulp.LpSolutionIntegerFeasible):
+            raise ValueError(f"No feasible schedule found (solver status: {pulp.LpStatus[prob.status]}). Try relaxing the constraints or increasing the units per intern.")
+
+        # Extract the solution into a (interns x dates) assignment matrix and
+        # compute all per-intern metrics with bulk NumPy ops instead of one
+        # pulp.value() call per cell
+        # Threshold at 0.5 rather than comparing to exactly 1: LP-based solvers
+        # can report binaries as 0.9999, which a straight int cast would drop
+        A = np.fromiter(
+            (1 if v.varValue is not None and v.varValue > 0.5 else 0 for row in V for v in row),
+            dtype=np.int8,
+            count=num_interns * num_dates,
+        ).reshape(num_interns, num_dates)
 
-        # Extract the solution and calculate metrics for each intern
         self.schedule = {d: [] for d in self.dates}
-        self.intern_metrics = {}
+        for ii, jj in zip(*np.nonzero(A)):
+            self.schedule[self.dates[jj]].append(self.interns[ii])
+
+        weekdays, saturdays, sundays, units_used, num_shifts, spacing_sums = _compute_metrics(A, self.units_arr, self.weekday_arr)
 
-        for i in self.interns:
-            shifts = []
-            total_units_used = 0
-            weekdays = saturdays = sundays = 0
-
-            for d in self.dates:
-                if pulp.value(intern_vars[(i, d)]) == 1:
-                    shifts.append(d)
-                    total_units_used += self.get_units_for_day(d)
-                    self.schedule[d].append(i)
-
-                    # Count the number of weekdays, saturdays, and sundays
-                    if d.weekday() < 5:
-                        weekdays += 1
-                    elif d.weekday() == 5:
-                        saturdays += 1
-                    elif d.weekday() == 6:
-                        sundays += 1
-
-            if shifts:
-                # Calculate average spacing between shifts
-                total_spacing = (shifts[0] - self.dates[0]).days + (self.dates[-1] - shifts[-1]).days
-                for j in range(1, len(shifts)):
-                    total_spacing += (shifts[j] - shifts[j-1]).days
-
-                average_spacing = total_spacing / (len(shifts) + 1)
+        self.intern_metrics = {}
+        for k, i in enumerate(self.interns):
+            if spacing_sums[k] >= 0:
+                average_spacing = float(spacing_sums[k]) / (num_shifts[k] + 1)
             else:
                 average_spacing = None  # No shifts assigned
 
             # Store metrics
             self.intern_metrics[i] = {
-                "total_units_used": total_units_used,
+                "total_units_used": int(units_used[k]),
                 "average_spacing": average_spacing,
-                "num_shifts": len(shifts),
-                "weekdays": weekdays,
-                "saturdays": saturdays,
-                "sundays": sundays
+                "num_shifts": int(num_shifts[k]),
+                "weekdays": int(weekdays[k]),
+                "saturdays": int(saturdays[k]),
+                "sundays": int(sundays[k])
             }
 
     def get_units_for_day(self, date):
-        if date.weekday() == 5:  # Saturday
-            return 2
-        elif date.weekday() == 6:  # Sunday
-            return 3
-        else:
-            return 1
+        return self.units[self._date_to_idx[date]]
 
     def print_schedule(self):
         if self.schedule:
@@ -194,19 +295,16 @@ class InternScheduler:
             raise ValueError("No schedule found. Please run the `.solve()` method first.")
 
         if not row_format:
-            # Create a list of all dates between start_date and end_date
-            dates = pd.date_range(start=self.start_date, end=self.end_date)
-
-            # Initialize the calendar DataFrame
+            # Initialize the calendar rows
             calendar_data = []
 
             # Track the current week
             current_week = []
 
             # Iterate over each date in the range
-            for date in dates:
+            for date in self.dates:
                 # Get the interns scheduled for the current date
-                interns_on_duty = self.schedule.get(date.to_pydatetime(), [])
+                interns_on_duty = self.schedule.get(date, [])
 
                 # Format the date and interns as a string
                 day_entry = f"{date.strftime('%Y-%m-%d')}:\n" + ', '.join(interns_on_duty) if interns_on_duty else "No duty"
@@ -215,41 +313,27 @@ class InternScheduler:
                 current_week.append(day_entry)
 
                 # Check if we have filled a week (7 days) or it's the last day
-                if len(current_week) == 7 or date == dates[-1]:
+                if len(current_week) == 7 or date == self.dates[-1]:
                     # Add the week to the calendar data
                     calendar_data.append(current_week)
                     # Reset the current week list
                     current_week = []
 
-            # Convert the calendar data to a DataFrame
-            calendar_df = pd.DataFrame(calendar_data, columns=['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'])
-
-            # Create a workbook and add the DataFrame as a sheet
+            # Create a workbook and write the rows directly to a sheet
             wb = Workbook()
             ws = wb.active
             ws.title = "Intern Duty Calendar"
 
-            # Write the DataFrame to the Excel sheet
-            for row in dataframe_to_rows(calendar_df, index=False, header=True):
+            ws.append(['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'])
+            for row in calendar_data:
                 ws.append(row)
 
-            # Save the workbook to an Excel file
+            # Save the workbook to an Excel file or writable file-like object
             wb.save(output_file)
-            print(f"Calendar saved to {output_file}")
+            if isinstance(output_file, (str, os.PathLike)):
+                print(f"Calendar saved to {output_file}")
 
         else:
-            # Create a list of all dates between start_date and end_date
-            dates = pd.date_range(start=self.start_date, end=self.end_date)
-
-            # Define a function to calculate the number of units for the day based on the day of the week
-            def get_units_for_day(date):
-                if date.weekday() == 5:  # Saturday
-                    return 2
-                elif date.weekday() == 6:  # Sunday
-                    return 3
-                else:
-                    return 1
-
             # Initialize the calendar data for rows
             calendar_data = []
 
@@ -257,9 +341,9 @@ class InternScheduler:
             max_interns_per_day = 0
 
             # Iterate over each date in the range
-            for date in dates:
+            for j, date in enumerate(self.dates):
                 # Get the interns scheduled for the current date
-                interns_on_duty = self.schedule.get(date.to_pydatetime(), [])
+                interns_on_duty = self.schedule.get(date, [])
 
                 # Update the maximum number of interns per day
                 max_interns_per_day = max(max_interns_per_day, len(interns_on_duty))
@@ -267,11 +351,8 @@ class InternScheduler:
                 # Format the full date
                 full_date = date.strftime('%A, %B %d, %Y')
 
-                # Get the number of units for the day
-                units = get_units_for_day(date)
-
                 # Create a row with the date, units, and intern list
-                row = [full_date, units] + interns_on_duty
+                row = [full_date, self.units[j]] + interns_on_duty
 
                 # Add the row to the calendar data
                 calendar_data.append(row)
@@ -279,13 +360,7 @@ class InternScheduler:
             # Prepare column headers: Date, Units, and "Intern 1", "Intern 2", etc.
             columns = ['Date', 'Units'] + [f"Intern {i+1}" for i in range(max_interns_per_day)]
 
-            # Convert the calendar data to a DataFrame
-            calendar_df = pd.DataFrame(calendar_data, columns=columns)
-
-            # Fill missing intern slots with "No duty"
-            calendar_df.fillna(" ", inplace=True)
-
-            # Create a workbook and add the DataFrame as a sheet
+            # Create a workbook and write the rows directly to a sheet
             wb = Workbook()
             ws = wb.active
             ws.title = "Intern Duty Calendar"
@@ -293,49 +368,34 @@ class InternScheduler:
             # Hide gridlines in the sheet
             ws.sheet_view.showGridLines = False
 
-            # Write the DataFrame to the Excel sheet
-            for row in dataframe_to_rows(calendar_df, index=False, header=True):
-                ws.append(row)
+            # Write the rows, padding short days so every column gets a cell
+            ws.append(columns)
+            for row in calendar_data:
+                ws.append(row + [" "] * (len(columns) - len(row)))
 
-            # Autofit columns
-            for col in ws.columns:
-                max_length = 0
-                column = col[0].column_letter  # Get the column name
-                for cell in col:
-                    try:
-                        max_length = max(max_length, len(str(cell.value)))
-                    except:
-                        pass
-                adjusted_width = (max_length + 2)
-                ws.column_dimensions[column].width = adjusted_width
-
-            # Set a minimum column width of 150 pixels (~21.43 Excel units)
+            # Autofit columns in a single pass (ws.columns re-scans every cell,
+            # so compute the width and apply the minimum together), with a
+            # minimum column width of 150 pixels (~21.43 Excel units)
             minimum_column_width = 21.43
             for col in ws.columns:
                 column = col[0].column_letter  # Get the column letter
-                ws.column_dimensions[column].width = max(ws.column_dimensions[column].width, minimum_column_width)
-
-            # Apply formatting to headers: bold text
-            header_font = Font(bold=True)
-            for cell in ws[1]:
-                cell.font = header_font
+                max_length = max((len(str(cell.value)) for cell in col if cell.value is not None), default=0)
+                ws.column_dimensions[column].width = max(max_length + 2, minimum_column_width)
 
-            # Apply borders to all cells
+            # Register one NamedStyle per look and assign styles by name;
+            # openpyxl deduplicates NamedStyles internally, so this allocates
+            # O(unique styles) style objects instead of one per cell write
             thin_border = Border(left=Side(style='thin'),
                                 right=Side(style='thin'),
                                 top=Side(style='thin'),
                                 bottom=Side(style='thin'))
 
-            for row in ws.iter_rows(min_row=1, max_row=ws.max_row, min_col=1, max_col=ws.max_column):
-                for cell in row:
-                    cell.border = thin_border
-
-            # Center the units column
-            for cell in ws['B']:  # Column B is the "Units" column
-                cell.alignment = Alignment(horizontal="center")
-
-            # Assign a color to each intern and create fills
-            intern_colors = {}
+            header_style = NamedStyle(name='header', font=Font(bold=True), border=thin_border)
+            body_style = NamedStyle(name='body', border=thin_border)
+            units_style = NamedStyle(name='units', border=thin_border, alignment=Alignment(horizontal="center"))
+            wb.add_named_style(header_style)
+            wb.add_named_style(body_style)
+            wb.add_named_style(units_style)
 
             # Extended color palette with 15 distinct colors
             color_choices = [
@@ -351,18 +411,29 @@ class InternScheduler:
             for row in calendar_data:
                 all_interns.update(row[2:])  # Collect all intern names (skipping date and units)
 
-            # Assign unique colors to each intern
+            # Register one style per intern combining their fill with the border
+            intern_styles = {}
             for index, intern in enumerate(all_interns):
                 color = color_choices[index % len(color_choices)]
-                intern_colors[intern] = PatternFill(start_color=color, end_color=color, fill_type="solid")
-
-            # Apply colors to intern cells in the sheet
-            for row in ws.iter_rows(min_row=2, max_row=ws.max_row, min_col=3, max_col=2 + max_interns_per_day):
+                style = NamedStyle(
+                    name=f'intern_{index}',
+                    fill=PatternFill(start_color=color, end_color=color, fill_type="solid"),
+                    border=thin_border,
+                )
+                wb.add_named_style(style)
+                intern_styles[intern] = style.name
+
+            # Single styling pass: headers, units column, intern cells, borders
+            for cell in ws[1]:
+                cell.style = 'header'
+            for row in ws.iter_rows(min_row=2, max_row=ws.max_row, min_col=1, max_col=ws.max_column):
                 for cell in row:
-                    intern_name = cell.value
-                    if intern_name in intern_colors:
-                        cell.fill = intern_colors[intern_name]
+                    if cell.column_letter == 'B':
+                        cell.style = 'units'
+                    else:
+                        cell.style = intern_styles.get(cell.value, 'body')
 
-            # Save the workbook to an Excel file
+            # Save the workbook to an Excel file or writable file-like object
             wb.save(output_file)
-            print(f"Calendar saved to {output_file}")
\ No newline at end of file
+            if isinstance(output_file, (str, os.PathLike)):
+                print(f"Calendar saved to {output_file}")
\ No newline at end of file